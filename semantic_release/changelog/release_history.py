@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import TYPE_CHECKING, TypedDict
 
 from git.objects.tag import TagObject
@@ -14,6 +15,7 @@ if TYPE_CHECKING:
     from re import Pattern
     from typing import Iterable, Iterator
 
+    from git.refs.tag import Tag
     from git.repo.base import Repo
     from git.util import Actor
 
@@ -28,6 +30,14 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+# A repository's tags rarely span more than a handful of UTC offsets, so share
+# the (immutable) tzinfo objects rather than building new ones for every tag
+@lru_cache(maxsize=64)
+def _tz_from_offset(tz_offset: int) -> timezone:
+    # git stores offsets as seconds west of UTC
+    return timezone(timedelta(seconds=-1 * tz_offset))
+
+
 class ReleaseHistory:
     @classmethod
     def from_git_history(
@@ -54,6 +64,13 @@ class ReleaseHistory:
         is_commit_released = False
         the_version: Version | None = None
 
+        # Resolving tag.commit reads the tag ref from disk, so resolve every tag
+        # once here rather than comparing each commit against every tag. Where
+        # several tags point at the same commit, the highest version wins.
+        tag_sha_2_tag_and_version: dict[str, tuple[Tag, Version]] = {}
+        for tag, version in all_git_tags_and_versions:
+            tag_sha_2_tag_and_version.setdefault(tag.commit.hexsha, (tag, version))
+
         for commit in repo.iter_commits():
             # mypy will be happy if we make this an explicit string
             commit_message = str(commit.message)
@@ -64,45 +81,40 @@ class ReleaseHistory:
             )
             log.debug("commit has type %s", commit_type)
 
-            for tag, version in all_git_tags_and_versions:
-                if tag.commit == commit:
-                    # we have found the latest commit introduced by this tag
-                    # so we create a new Release entry
-                    log.debug("found commit %s for tag %s", commit.hexsha, tag.name)
-                    is_commit_released = True
-                    the_version = version
-
-                    # tag.object is a Commit if the tag is lightweight, otherwise
-                    # it is a TagObject with additional metadata about the tag
-                    if isinstance(tag.object, TagObject):
-                        tagger = tag.object.tagger
-                        committer = tag.object.tagger.committer()
-                        _tz = timezone(
-                            timedelta(seconds=-1 * tag.object.tagger_tz_offset)
-                        )
-                        tagged_date = datetime.fromtimestamp(
-                            tag.object.tagged_date, tz=_tz
-                        )
-                    else:
-                        # For some reason, sometimes tag.object is a Commit
-                        tagger = tag.object.author
-                        committer = tag.object.author
-                        _tz = timezone(
-                            timedelta(seconds=-1 * tag.object.author_tz_offset)
-                        )
-                        tagged_date = datetime.fromtimestamp(
-                            tag.object.committed_date, tz=_tz
-                        )
-
-                    release = Release(
-                        tagger=tagger,
-                        committer=committer,
-                        tagged_date=tagged_date,
-                        elements=defaultdict(list),
+            tag_and_version = tag_sha_2_tag_and_version.get(commit.hexsha, None)
+            if tag_and_version is not None:
+                # we have found the latest commit introduced by this tag
+                # so we create a new Release entry
+                tag, the_version = tag_and_version
+                log.debug("found commit %s for tag %s", commit.hexsha, tag.name)
+                is_commit_released = True
+
+                # tag.object is a Commit if the tag is lightweight, otherwise
+                # it is a TagObject with additional metadata about the tag.
+                # Each access re-reads the ref, so only look it up once
+                tag_object = tag.object
+                if isinstance(tag_object, TagObject):
+                    tagger = tag_object.tagger
+                    committer = tag_object.tagger.committer()
+                    _tz = _tz_from_offset(tag_object.tagger_tz_offset)
+                    tagged_date = datetime.fromtimestamp(tag_object.tagged_date, tz=_tz)
+                else:
+                    # For some reason, sometimes tag.object is a Commit
+                    tagger = tag_object.author
+                    committer = tag_object.author
+                    _tz = _tz_from_offset(tag_object.author_tz_offset)
+                    tagged_date = datetime.fromtimestamp(
+                        tag_object.committed_date, tz=_tz
                     )
 
-                    released.setdefault(the_version, release)
-                    break
+                release = Release(
+                    tagger=tagger,
+                    committer=committer,
+                    tagged_date=tagged_date,
+                    elements=defaultdict(list),
+                )
+
+                released.setdefault(the_version, release)
 
             if any(pat.match(commit_message) for pat in exclude_commit_patterns):
                 log.debug(
@@ -670,6 +670,8 @@ def version(  # noqa: C901
                 no_verify=no_verify,
             )
 
+    new_version_tag = new_version.as_tag()
+
     # Run the tagging after potentially creating a new HEAD commit.
     # This way if no source code is modified, i.e. all metadata updates
     # are disabled, and the changelog generation is disabled or it's not
@@ -681,13 +683,13 @@ def version(  # noqa: C901
                 indented(
                     f"""
                     would have run:
-                        git tag -a {new_version.as_tag()} -m "{new_version.as_tag()}"
+                        git tag -a {new_version_tag} -m "{new_version_tag}"
                     """
                 )
             )
         else:
             with custom_git_environment():
-                repo.git.tag("-a", new_version.as_tag(), m=new_version.as_tag())
+                repo.git.tag("-a", new_version_tag, m=new_version_tag)
 
     if push_changes:
         remote_url = runtime.hvcs_client.remote_url(
@@ -711,7 +713,7 @@ def version(  # noqa: C901
                 indented(
                     f"""
                     would have run:
-                        git push {runtime.masker.mask(remote_url)} tag {new_version.as_tag()}
+                        git push {runtime.masker.mask(remote_url)} tag {new_version_tag}
                     """  # noqa: E501
                 )
             )
@@ -721,15 +723,13 @@ def version(  # noqa: C901
             # Resolves issue #803 where a tag that already existed was pushed and caused
             # a failure. Its not clear why there was an incorrect tag (likely user error change)
             # but we will avoid possibly pushing an separate tag that we didn't create.
-            repo.git.push(remote_url, "tag", new_version.as_tag())
+            repo.git.push(remote_url, "tag", new_version_tag)
 
     gha_output.released = True
 
     if make_vcs_release and isinstance(hvcs_client, RemoteHvcsBase):
         if opts.noop:
-            noop_report(
-                f"would have created a release for the tag {new_version.as_tag()!r}"
-            )
+            noop_report(f"would have created a release for the tag {new_version_tag!r}")
 
         release = rh.released[new_version]
         # Use a new, non-configurable environment for release notes -
@@ -755,7 +755,7 @@ def version(  # noqa: C901
         else:
             try:
                 hvcs_client.create_release(
-                    tag=new_version.as_tag(),
+                    tag=new_version_tag,
                     release_notes=release_notes,
                     prerelease=new_version.is_prerelease,
                     assets=assets,
@@ -13,7 +13,7 @@ from pydantic.dataclasses import dataclass
 
 from semantic_release.commit_parser._base import CommitParser, ParserOptions
 from semantic_release.commit_parser.token import ParsedCommit, ParseError, ParseResult
-from semantic_release.commit_parser.util import breaking_re, parse_paragraphs
+from semantic_release.commit_parser.util import breaking_re, parse_paragraphs_tuple
 from semantic_release.enums import LevelBump
 
 if TYPE_CHECKING:
@@ -67,15 +67,20 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
 
     def __init__(self, options: AngularParserOptions | None = None) -> None:
         super().__init__(options)
+        # Longest types first, so when one type is a prefix of another (e.g. fix
+        # and fixup) the engine doesn't first commit to the shorter alternative
+        # and have to backtrack out of it
+        all_possible_types = "|".join(
+            sorted(self.options.allowed_tags, key=len, reverse=True)
+        )
         self.re_parser = re.compile(
             rf"""
-            (?P<type>{"|".join(self.options.allowed_tags)})  # e.g. feat
+            (?P<type>{all_possible_types})  # e.g. feat
             (?:\((?P<scope>[^\n]+)\))?  # or feat(parser)
             (?P<break>!)?:\s+  # breaking if feat!:
             (?P<subject>[^\n]+)  # commit subject
-            (:?\n\n(?P<text>.+))?  # commit body
             """,
-            flags=re.VERBOSE | re.DOTALL,
+            flags=re.VERBOSE,
         )
 
     @staticmethod
@@ -100,18 +105,23 @@ class AngularCommitParser(CommitParser[ParseResult, AngularParserOptions]):
         parsed_break = parsed.group("break")
         parsed_scope = parsed.group("scope")
         parsed_subject = parsed.group("subject")
-        parsed_text = parsed.group("text")
         parsed_type = parsed.group("type")
 
-        descriptions = parse_paragraphs(parsed_text) if parsed_text else []
-        # Insert the subject before the other paragraphs
-        descriptions.insert(0, parsed_subject)
+        # The body is everything after the blank line which must directly follow
+        # the subject; slicing it off avoids a DOTALL scan over the whole body
+        header_end = parsed.end()
+        parsed_text = (
+            message[header_end + 2 :] if message.startswith("\n\n", header_end) else ""
+        )
+
+        # Read the cached paragraphs directly; the only copy made is the
+        # descriptions list below, which starts with the subject
+        paragraphs = parse_paragraphs_tuple(parsed_text) if parsed_text else ()
+        descriptions = [parsed_subject, *paragraphs]
 
         # Look for descriptions of breaking changes
         breaking_descriptions = [
-            match.group(1)
-            for match in (breaking_re.match(p) for p in descriptions[1:])
-            if match
+            match.group(1) for match in map(breaking_re.match, paragraphs) if match
         ]
 
         if parsed_break or breaking_descriptions:
@@ -1,9 +1,10 @@
 """Commit parser which looks for emojis to determine the type of commit"""
 
+from __future__ import annotations
+
 import logging
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
-from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
 from semantic_release.commit_parser._base import CommitParser, ParserOptions
@@ -11,6 +12,9 @@ from semantic_release.commit_parser.token import ParsedCommit, ParseResult
 from semantic_release.commit_parser.util import parse_paragraphs
 from semantic_release.enums import LevelBump
 
+if TYPE_CHECKING:
+    from git.objects.commit import Commit
+
 logger = logging.getLogger(__name__)
 
 
@@ -60,35 +64,39 @@ class EmojiCommitParser(CommitParser[ParseResult, EmojiParserOptions]):
     # TODO: Deprecate in lieu of get_default_options()
     parser_options = EmojiParserOptions
 
+    def __init__(self, options: EmojiParserOptions | None = None) -> None:
+        super().__init__(options)
+        # Ordered from most important to least important, so that the first
+        # emoji found in a subject is the one with the highest bump level
+        self.all_emojis = (
+            self.options.major_tags + self.options.minor_tags + self.options.patch_tags
+        )
+        # Higher levels are merged last so they win for emojis listed twice
+        self.emoji_to_level = {
+            **dict.fromkeys(self.options.patch_tags, LevelBump.PATCH),
+            **dict.fromkeys(self.options.minor_tags, LevelBump.MINOR),
+            **dict.fromkeys(self.options.major_tags, LevelBump.MAJOR),
+        }
+
     @staticmethod
     def get_default_options() -> EmojiParserOptions:
         return EmojiParserOptions()
 
     def parse(self, commit: Commit) -> ParseResult:
-        all_emojis = (
-            self.options.major_tags + self.options.minor_tags + self.options.patch_tags
-        )
-
         message = str(commit.message)
-        subject = message.split("\n")[0]
+        subject = message.split("\n", 1)[0]
 
         # Loop over emojis from most important to least important
         # Therefore, we find the highest level emoji first
         primary_emoji = "Other"
-        for emoji in all_emojis:
+        for emoji in self.all_emojis:
             if emoji in subject:
                 primary_emoji = emoji
                 break
         logger.debug("Selected %s as the primary emoji", primary_emoji)
 
         # Find which level this commit was from
-        level_bump = LevelBump.NO_RELEASE
-        if primary_emoji in self.options.major_tags:
-            level_bump = LevelBump.MAJOR
-        elif primary_emoji in self.options.minor_tags:
-            level_bump = LevelBump.MINOR
-        elif primary_emoji in self.options.patch_tags:
-            level_bump = LevelBump.PATCH
+        level_bump = self.emoji_to_level.get(primary_emoji, LevelBump.NO_RELEASE)
 
         # All emojis will remain part of the returned description
         descriptions = parse_paragraphs(message)
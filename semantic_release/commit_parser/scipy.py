@@ -150,16 +150,13 @@ class ScipyCommitParser(CommitParser[ParseResult, ScipyParserOptions]):
         else:
             blocks = [subject]
 
-        for tag in self.options.allowed_tags:
-            if tag == parsed.group("tag"):
-                section = tag_to_section.get(tag, "None")
-                level_bump = self.options.tag_to_level.get(
-                    tag, self.options.default_level_bump
-                )
-                log.debug(
-                    "commit %s introduces a %s level_bump", commit.hexsha, level_bump
-                )
-                break
+        parsed_tag = parsed.group("tag")
+        if parsed_tag in self.options.allowed_tags:
+            section = tag_to_section.get(parsed_tag, "None")
+            level_bump = self.options.tag_to_level.get(
+                parsed_tag, self.options.default_level_bump
+            )
+            log.debug("commit %s introduces a %s level_bump", commit.hexsha, level_bump)
         else:
             # some commits may not have a tag, e.g. if they belong to a PR that
             # wasn't squashed (for maintainability) ignore them
@@ -1,9 +1,11 @@
 """Legacy commit parser from Python Semantic Release 1.0"""
 
+from __future__ import annotations
+
 import logging
 import re
+from typing import TYPE_CHECKING
 
-from git.objects.commit import Commit
 from pydantic.dataclasses import dataclass
 
 from semantic_release.commit_parser._base import CommitParser, ParserOptions
@@ -11,6 +13,9 @@ from semantic_release.commit_parser.token import ParsedCommit, ParseError, Parse
 from semantic_release.commit_parser.util import breaking_re, parse_paragraphs
 from semantic_release.enums import LevelBump
 
+if TYPE_CHECKING:
+    from git.objects.commit import Commit
+
 log = logging.getLogger(__name__)
 
 re_parser = re.compile(r"(?P<subject>[^\n]+)" + r"(:?\n\n(?P<text>.+))?", re.DOTALL)
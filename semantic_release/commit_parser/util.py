@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 
 breaking_re = re.compile(r"BREAKING[ -]CHANGE:\s?(.*)")
 
@@ -16,12 +17,26 @@ def parse_paragraphs(text: str) -> list[str]:
     :param text: The text string to be divided.
     :return: A list of condensed paragraphs, as strings.
     """
-    return list(
+    # Callers are free to mutate the result, so hand out a fresh list each time
+    return list(parse_paragraphs_tuple(text))
+
+
+# The same commit bodies are split once while determining the next version and
+# again while building the changelog, so remember the most recent results
+@lru_cache(maxsize=4096)
+def parse_paragraphs_tuple(text: str) -> tuple[str, ...]:
+    """
+    Like :func:`parse_paragraphs`, but return the paragraphs as a tuple which
+    is shared between callers, so it can be cached without being copied.
+    """
+    # Most commit messages only use LF line endings, and a containment check is
+    # much cheaper than a replace() that finds nothing to replace
+    if "\r" in text:
+        text = text.replace("\r", "")
+
+    return tuple(
         filter(
             None,
-            [
-                paragraph.replace("\n", " ").strip()
-                for paragraph in text.replace("\r", "").split("\n\n")
-            ],
+            [paragraph.replace("\n", " ").strip() for paragraph in text.split("\n\n")],
         )
     )
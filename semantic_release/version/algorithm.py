@@ -368,7 +368,7 @@ def next_version(
 
     # Step 4. Parse each commit since the last release and find any tags that have
     # been added since then.
-    parsed_levels: set[LevelBump] = set()
+    level_bump = LevelBump.NO_RELEASE
     latest_version = latest_full_version_in_history or Version(
         0,
         0,
@@ -396,13 +396,20 @@ def next_version(
 
     # N.B. these should be sorted so long as we iterate the commits in reverse order
     for commit in commits_since_last_full_release:
-        parse_result = commit_parser.parse(commit)
-        if isinstance(parse_result, ParsedCommit):
-            log.debug(
-                "adding %s to the levels identified in commits_since_last_full_release",
-                parse_result.bump,
-            )
-            parsed_levels.add(parse_result.bump)
+        # Nothing outranks a major bump, so once one is found the remaining
+        # commits are only walked to find the latest tag
+        if level_bump is not LevelBump.MAJOR:
+            parse_result = commit_parser.parse(commit)
+            if (
+                isinstance(parse_result, ParsedCommit)
+                and parse_result.bump > level_bump
+            ):
+                log.debug(
+                    "raising the level identified in commits_since_last_full_release "
+                    "to %s",
+                    parse_result.bump,
+                )
+                level_bump = parse_result.bump
 
         log.debug("checking if commit %s matches any tags", commit.hexsha)
         t_v = tag_sha_2_version_lookup.get(commit.hexsha, None)
@@ -424,12 +431,6 @@ def next_version(
         )
         break
 
-    log.debug(
-        "parsed the following distinct levels from the commits since the last release: "
-        "%s",
-        parsed_levels,
-    )
-    level_bump = max(parsed_levels, default=LevelBump.NO_RELEASE)
     log.info("The type of the next release release is: %s", level_bump)
     if level_bump is LevelBump.NO_RELEASE:  # noqa: SIM102
         if latest_version.major != 0 or allow_zero_version:
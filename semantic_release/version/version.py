@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import logging
 import re
-from functools import wraps
+from functools import lru_cache, wraps
 from itertools import zip_longest
-from typing import Callable, Union, overload
+from typing import Callable, NamedTuple, Union, overload
 
 from semantic_release.const import SEMVER_REGEX
 from semantic_release.enums import LevelBump
@@ -13,6 +13,8 @@ from semantic_release.helpers import check_tag_format
 
 log = logging.getLogger(__name__)
 
+_PRERELEASE_REGEX = re.compile(r"(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)")
+
 
 # Very heavily inspired by semver.version:_comparator, I don't think there's
 # a cleaner way to do this
@@ -97,7 +99,6 @@ class Version:
         check_tag_format(new_format)
         self._tag_format = new_format
 
-    # Maybe cache?
     @classmethod
     def parse(
         cls,
@@ -117,47 +118,36 @@ class Version:
             raise InvalidVersion(f"{version_str!r} cannot be parsed as a Version")
 
         log.debug("attempting to parse string %r as Version", version_str)
-        match = cls._VERSION_REGEX.fullmatch(version_str)
-        if not match:
-            raise InvalidVersion(f"{version_str!r} is not a valid Version")
-
-        prerelease = match.group("prerelease")
-        if prerelease:
-            pm = re.match(r"(?P<token>[a-zA-Z0-9-\.]+)\.(?P<revision>\d+)", prerelease)
-            if not pm:
-                raise NotImplementedError(
-                    f"{cls.__qualname__} currently supports only prereleases "
-                    r"of the format (-([a-zA-Z0-9-])\.\(\d+)), for example "
-                    r"'1.2.3-my-custom-3rc.4'."
-                )
-            prerelease_token, prerelease_revision = pm.groups()
+        try:
+            parts = _parse_version_parts(cls._VERSION_REGEX, version_str)
+        except NotImplementedError as err:
+            raise NotImplementedError(f"{cls.__qualname__} {err}") from None
+
+        if parts.prerelease_revision is not None:
             log.debug(
                 "parsed prerelease_token %s, prerelease_revision %s from version "
                 "string %s",
-                prerelease_token,
-                prerelease_revision,
+                parts.prerelease_token,
+                parts.prerelease_revision,
                 version_str,
             )
         else:
-            prerelease_revision = None
             log.debug("version string %s parsed as a non-prerelease", version_str)
 
-        build_metadata = match.group("buildmetadata") or ""
         log.debug(
             "parsed build metadata %r from version string %s",
-            build_metadata,
+            parts.build_metadata,
             version_str,
         )
 
+        # Always build a new instance, as callers are free to mutate the result
         return Version(
-            int(match.group("major")),
-            int(match.group("minor")),
-            int(match.group("patch")),
-            prerelease_token=prerelease_token,
-            prerelease_revision=(
-                int(prerelease_revision) if prerelease_revision else None
-            ),
-            build_metadata=build_metadata,
+            parts.major,
+            parts.minor,
+            parts.patch,
+            prerelease_token=parts.prerelease_token or prerelease_token,
+            prerelease_revision=parts.prerelease_revision,
+            build_metadata=parts.build_metadata,
             tag_format=tag_format,
         )
 
@@ -391,3 +381,49 @@ class Version:
             prerelease_token=self.prerelease_token,
             tag_format=self.tag_format,
         )
+
+
+class _VersionParts(NamedTuple):
+    major: int
+    minor: int
+    patch: int
+    prerelease_token: str | None
+    prerelease_revision: int | None
+    build_metadata: str
+
+
+# Every tag in the repository is parsed each time the tags are listed, which
+# happens several times during a single command, so remember the results.
+# The cache is unbounded as the tags are always listed in the same order, and
+# an LRU smaller than the number of tags would evict every entry before reuse.
+# It is keyed on the pattern too, as subclasses may override _VERSION_REGEX
+@lru_cache(maxsize=None)
+def _parse_version_parts(
+    version_regex: re.Pattern[str], version_str: str
+) -> _VersionParts:
+    match = version_regex.fullmatch(version_str)
+    if not match:
+        raise InvalidVersion(f"{version_str!r} is not a valid Version")
+
+    prerelease = match.group("prerelease")
+    if prerelease:
+        pm = _PRERELEASE_REGEX.match(prerelease)
+        if not pm:
+            # Version.parse prefixes the name of the class it was called on
+            raise NotImplementedError(
+                "currently supports only prereleases "
+                r"of the format (-([a-zA-Z0-9-])\.\(\d+)), for example "
+                r"'1.2.3-my-custom-3rc.4'."
+            )
+        prerelease_token, prerelease_revision = pm.groups()
+    else:
+        prerelease_token, prerelease_revision = None, None
+
+    return _VersionParts(
+        int(match.group("major")),
+        int(match.group("minor")),
+        int(match.group("patch")),
+        prerelease_token=prerelease_token,
+        prerelease_revision=int(prerelease_revision) if prerelease_revision else None,
+        build_metadata=match.group("buildmetadata") or "",
+    )
@@ -183,6 +183,23 @@ def test_parser_custom_allowed_types(make_commit_obj: MakeCommitObjFn):
     assert isinstance(parser.parse(make_commit_obj("feat(parser): ...")), ParseError)
 
 
+@pytest.mark.parametrize(
+    "commit_message, expected_type",
+    [
+        ("fix: correct a thing", "fix"),
+        ("fixup: squash me later", "fixup"),
+        ("fixup(scope): squash me later", "fixup"),
+    ],
+)
+def test_parser_custom_allowed_types_sharing_a_prefix(
+    make_commit_obj: MakeCommitObjFn, commit_message: str, expected_type: str
+):
+    parser = AngularCommitParser(AngularParserOptions(allowed_tags=("fix", "fixup")))
+    result = parser.parse(make_commit_obj(commit_message))
+    assert isinstance(result, ParsedCommit)
+    assert result.type == expected_type
+
+
 def test_parser_custom_minor_tags(make_commit_obj: MakeCommitObjFn):
     options = AngularParserOptions(minor_tags=("docs",))
     parser = AngularCommitParser(options)
@@ -4,12 +4,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from semantic_release.commit_parser.emoji import (
+    EmojiCommitParser,
+    EmojiParserOptions,
+)
 from semantic_release.commit_parser.token import ParsedCommit
 from semantic_release.enums import LevelBump
 
 if TYPE_CHECKING:
-    from semantic_release.commit_parser.emoji import EmojiCommitParser
-
     from tests.conftest import MakeCommitObjFn
 
 
@@ -83,3 +85,14 @@ def test_default_emoji_parser(
     assert type_ == result.type
     assert descriptions == result.descriptions
     assert breaking_descriptions == result.breaking_descriptions
+
+
+def test_emoji_listed_on_several_levels_uses_highest(
+    make_commit_obj: MakeCommitObjFn,
+):
+    options = EmojiParserOptions(major_tags=(":boom:", ":bug:"))
+    parser = EmojiCommitParser(options)
+    result = parser.parse(make_commit_obj(":bug: Fixing a bug"))
+
+    assert isinstance(result, ParsedCommit)
+    assert LevelBump.MAJOR is result.bump
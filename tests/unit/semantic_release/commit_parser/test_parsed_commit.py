@@ -3,7 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from semantic_release import LevelBump
-from semantic_release.commit_parser import ParsedCommit
+from semantic_release.commit_parser import ParsedCommit, ParseError
 
 if TYPE_CHECKING:
     from tests.conftest import MakeCommitObjFn
@@ -25,3 +25,12 @@ def test_parsed_commit_computed_properties(make_commit_obj: MakeCommitObjFn):
     assert message == parsed_commit.message
     assert commit.hexsha == parsed_commit.hexsha
     assert commit.hexsha[:7] == parsed_commit.short_hash
+
+
+def test_parse_results_normalize_message(make_commit_obj: MakeCommitObjFn):
+    commit = make_commit_obj("fix: a bug\r\n\r\nMore details\r\n")
+    commit.message = commit.message.encode("utf-8")  # type: ignore[assignment]
+
+    parse_error = ParseError(commit, error="some error")
+
+    assert parse_error.message == "fix: a bug\n\nMore details\n"
@@ -1,6 +1,6 @@
 import pytest
 
-from semantic_release.commit_parser.util import parse_paragraphs
+from semantic_release.commit_parser.util import breaking_re, parse_paragraphs
 
 
 @pytest.mark.parametrize(
@@ -24,3 +24,29 @@ from semantic_release.commit_parser.util import parse_paragraphs
 )
 def test_parse_paragraphs(text, expected):
     assert parse_paragraphs(text) == expected
+
+
+@pytest.mark.parametrize(
+    "paragraph, expected",
+    [
+        ("BREAKING CHANGE: drop support", "drop support"),
+        ("BREAKING-CHANGE: drop support", "drop support"),
+        ("BREAKING CHANGE:drop support", "drop support"),
+        ("BREAKING CHANGE:\xa0drop support", "drop support"),
+        ("BREAKING CHANGE:\u3000drop support", "drop support"),
+        ("BREAKING CHANGE: ", ""),
+        ("See BREAKING CHANGE: not at start", None),
+        ("BREAKING CHANGE without colon", None),
+    ],
+)
+def test_breaking_re(paragraph, expected):
+    match = breaking_re.match(paragraph)
+    assert (match.group(1) if match else None) == expected
+
+
+def test_parse_paragraphs_result_is_not_shared():
+    text = "A\n\nB"
+    first = parse_paragraphs(text)
+    first.insert(0, "subject")
+
+    assert parse_paragraphs(text) == ["A", "B"]
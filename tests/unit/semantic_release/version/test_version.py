@@ -1,8 +1,10 @@
 import operator
 import random
+import re
 
 import pytest
 
+from semantic_release.const import SEMVER_REGEX
 from semantic_release.enums import LevelBump
 from semantic_release.errors import InvalidVersion
 from semantic_release.version.version import Version
@@ -320,6 +322,40 @@ def test_version_hashable(a_version):
     assert True
 
 
+def test_version_parse_returns_independent_instances():
+    first = Version.parse("1.2.3-rc.1", tag_format="v{version}")
+    first.build_metadata = "build.1"
+    second = Version.parse("1.2.3-rc.1", tag_format="custom-{version}")
+
+    assert first is not second
+    assert second.build_metadata == ""
+    assert second.tag_format == "custom-{version}"
+    assert second.prerelease_token == "rc"
+    assert second.prerelease_revision == 1
+
+
+def test_version_parse_uses_given_token_for_full_release():
+    assert Version.parse("1.2.3").prerelease_token == "rc"
+    assert Version.parse("1.2.3", prerelease_token="beta").prerelease_token == "beta"
+
+
+def test_version_parse_unsupported_prerelease_names_subclass():
+    class CustomVersion(Version):
+        pass
+
+    with pytest.raises(NotImplementedError, match="CustomVersion currently"):
+        CustomVersion.parse("1.2.3-rc")
+
+
+def test_version_parse_uses_subclass_regex():
+    class PrefixedVersion(Version):
+        _VERSION_REGEX = re.compile(r"v" + SEMVER_REGEX.pattern, flags=re.VERBOSE)
+
+    assert PrefixedVersion.parse("v1.2.3") == Version(1, 2, 3)
+    with pytest.raises(InvalidVersion):
+        Version.parse("v1.2.3")
+
+
 # NOTE: this might be a really good first candidate for hypothesis
 @pytest.mark.parametrize(
     "major, minor, patch, prerelease_revision",